@@ -0,0 +1,131 @@
+from typing import (Callable, ClassVar, Dict, Iterable, List, Sequence, Tuple,
+                    Type, Union)
+
+import numpy as np
+from numba import njit
+
+from homework import (TRAINING_CLASSES, Running, SportsWalking, Swimming,
+                      Training)
+
+# Коэффициенты заданы числами: numba встраивает их в скомпилированный
+# и закэшированный код, а кэш сбрасывается только при изменении этого
+# файла. Совпадение с константами классов из homework.py проверяют тесты.
+RUN_SPEED_COEFF = 0.0117  # coeff_cal_1 * LEN_STEP / M_IN_KM
+RUN_SPEED_SHIFT = 20.0  # coeff_cal_2
+RUN_MINUTES_COEFF = 0.06  # MIN_IN_HOUR / M_IN_KM
+
+WLK_LEN_STEP = 0.65
+WLK_M_IN_KM = 1000
+WLK_MIN_IN_HOUR = 60
+WLK_COEFF_1 = 0.035
+WLK_COEFF_2 = 0.029
+
+SWM_SPEED_COEFF = 0.002  # SPEED_COEFF / M_IN_KM
+SWM_SPEED_SHIFT = 2.2  # ADD_COEFF * SPEED_COEFF
+
+
+@njit('f8[:](f8[:], f8[:], f8[:])', cache=True, fastmath=True)
+def running_calories(action: np.ndarray,
+                     duration: np.ndarray,
+                     weight: np.ndarray) -> np.ndarray:
+    """Посчитать калории для массива тренировок `Running`.
+
+    (18 * action * LEN_STEP / M_IN_KM / duration - 20) * weight / M_IN_KM
+    * duration * MIN_IN_HOUR = (RUN_SPEED_COEFF * action / duration
+    - RUN_SPEED_SHIFT) * weight * RUN_MINUTES_COEFF * duration.
+    """
+    calories = np.empty_like(duration)
+    for i in range(duration.size):
+        mean_speed_term = RUN_SPEED_COEFF * action[i] / duration[i]
+        calories[i] = ((mean_speed_term - RUN_SPEED_SHIFT) * weight[i]
+                       * RUN_MINUTES_COEFF * duration[i])
+    return calories
+
+
+# Без fastmath: приближённое деление может сдвинуть результат
+# целочисленного деления speed**2 // height на единицу.
+@njit('f8[:](f8[:], f8[:], f8[:], f8[:])', cache=True)
+def walking_calories(action: np.ndarray,
+                     duration: np.ndarray,
+                     weight: np.ndarray,
+                     height: np.ndarray) -> np.ndarray:
+    """Посчитать калории для массива тренировок `SportsWalking`."""
+    calories = np.empty_like(duration)
+    for i in range(duration.size):
+        minutes = duration[i] * WLK_MIN_IN_HOUR
+        mean_speed = action[i] * WLK_LEN_STEP / WLK_M_IN_KM / duration[i]
+        speed_to_height = (mean_speed * mean_speed) // height[i]
+        cal_by_kilo = WLK_COEFF_1 + speed_to_height * WLK_COEFF_2
+        calories[i] = weight[i] * cal_by_kilo * minutes
+    return calories
+
+
+@njit('f8[:](f8[:], f8[:], f8[:], f8[:], f8[:])', cache=True, fastmath=True)
+def swimming_calories(action: np.ndarray,
+                      duration: np.ndarray,
+                      weight: np.ndarray,
+                      length_pool: np.ndarray,
+                      count_pool: np.ndarray) -> np.ndarray:
+    """Посчитать калории для массива тренировок `Swimming`.
+
+    (length_pool * count_pool / M_IN_KM / duration + ADD_COEFF)
+    * SPEED_COEFF * weight = (SWM_SPEED_COEFF * length_pool * count_pool
+    / duration + SWM_SPEED_SHIFT) * weight.
+    """
+    calories = np.empty_like(duration)
+    for i in range(duration.size):
+        total_length = length_pool[i] * count_pool[i]
+        calories[i] = ((SWM_SPEED_COEFF * total_length / duration[i]
+                        + SWM_SPEED_SHIFT) * weight[i])
+    return calories
+
+
+class TrainingBatch:
+    """Пакет однотипных тренировок.
+
+    Данные хранятся по столбцам: один массив float64 на каждый
+    параметр конструктора соответствующего класса тренировки.
+    """
+
+    # Ядро расчёта калорий и число значений в пакете для каждого класса.
+    CALORIE_KERNELS: ClassVar[
+        Dict[Type[Training], Tuple[Callable[..., np.ndarray], int]]
+    ] = {
+        Swimming: (swimming_calories, 5),
+        Running: (running_calories, 3),
+        SportsWalking: (walking_calories, 4),
+    }
+
+    def __init__(self,
+                 workout_type: str,
+                 data: Sequence[Sequence[Union[int, float]]]) -> None:
+        self.workout_type = workout_type
+        training = TRAINING_CLASSES[workout_type]
+        self.kernel, package_size = self.CALORIE_KERNELS[training]
+        if not data:
+            raise ValueError(
+                f'Пакет тренировок {workout_type} не содержит данных!')
+        for row in data:
+            if len(row) != package_size:
+                raise ValueError(
+                    f'Для тренировки {workout_type} ожидается '
+                    f'{package_size} значений, получено {len(row)}: {row}')
+        self.columns: Tuple[np.ndarray, ...] = tuple(
+            np.fromiter(column, dtype=np.float64, count=len(data))
+            for column in zip(*data)
+        )
+
+    def get_spent_calories(self) -> np.ndarray:
+        """Получить массив затраченных калорий для всех тренировок."""
+        return self.kernel(*self.columns)
+
+
+def read_package_batch(
+    packages: Iterable[Tuple[str, Sequence[Union[int, float]]]]
+) -> List[TrainingBatch]:
+    """Сгруппировать пакеты от датчиков по типу тренировки."""
+    grouped: Dict[str, List[Sequence[Union[int, float]]]] = {}
+    for workout_type, data in packages:
+        grouped.setdefault(workout_type, []).append(data)
+    return [TrainingBatch(workout_type, data)
+            for workout_type, data in grouped.items()]
@@ -1,8 +1,8 @@
-from dataclasses import dataclass, asdict
-from typing import Dict, Type, ClassVar, List, Union
+from dataclasses import dataclass
+from typing import Dict, List, Type, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class InfoMessage:
     """Информационное сообщение о тренировке."""
 
@@ -12,19 +12,24 @@ class InfoMessage:
     speed: float
     calories: float
 
-    MESSAGE_TEMPLATE: ClassVar[str] = ('Тип тренировки: {training_type}; '
-                                       'Длительность: {duration:.3f} ч.; '
-                                       'Дистанция: {distance:.3f} км; '
-                                       'Ср. скорость: {speed:.3f} км/ч; '
-                                       'Потрачено ккал: {calories:.3f}.')
-
     def get_message(self) -> str:
         """Возвращает информационное сообщение о тренировке."""
-        return self.MESSAGE_TEMPLATE.format(**asdict(self))
+        return (f'Тип тренировки: {self.training_type}; '
+                f'Длительность: {self.duration:.3f} ч.; '
+                f'Дистанция: {self.distance:.3f} км; '
+                f'Ср. скорость: {self.speed:.3f} км/ч; '
+                f'Потрачено ккал: {self.calories:.3f}.')
 
 
 class Training:
-    """Базовый класс тренировки."""
+    """Базовый класс тренировки.
+
+    Наследники задают расчёт скорости и калорий в методах
+    `_mean_speed_from` и `_calories_from`: их вызывают и публичные
+    методы, и `show_training_info`.
+    """
+
+    __slots__ = ('action', 'duration', 'weight')
 
     LEN_STEP: float = 0.65
     M_IN_KM: int = 1000
@@ -45,13 +50,20 @@ class Training:
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения в км/ч."""
-        distance = self.get_distance()
+        return self._mean_speed_from(self.get_distance())
+
+    def _mean_speed_from(self, distance: float) -> float:
+        """Посчитать среднюю скорость по уже известной дистанции."""
         return distance / self.duration
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
+        return self._calories_from(self.get_mean_speed())
+
+    def _calories_from(self, mean_speed: float) -> float:
+        """Посчитать калории по уже известной средней скорости."""
         raise NotImplementedError(
-            f'Метод get_spent_calories в классе {self.class_name} '
+            f'Метод _calories_from в классе {self.class_name} '
             f'необходимо реализовать!')
 
     @property
@@ -63,8 +75,8 @@ class Training:
         training_type = self.class_name
         duration = self.duration
         distance = self.get_distance()
-        speed = self.get_mean_speed()
-        calories = self.get_spent_calories()
+        speed = self._mean_speed_from(distance)
+        calories = self._calories_from(speed)
         return InfoMessage(training_type,
                            duration,
                            distance,
@@ -75,16 +87,17 @@ class Training:
 class Running(Training):
     """Тренировка: бег."""
 
+    __slots__ = ()
+
     coeff_cal_1: float = 18.0
     coeff_cal_2: float = 20.0
 
-    def get_spent_calories(self) -> float:
-        """Получить количество затраченных калорий.
+    def _calories_from(self, mean_speed: float) -> float:
+        """Посчитать калории по уже известной средней скорости.
 
         Рассчитывается по формуле:
         (18 * mean_speed - 20) * weight / M_IN_KM * duration_in_minutes.
         """
-        mean_speed = self.get_mean_speed()
         minutes = self.duration * self.MIN_IN_HOUR
         calories_per_kilo = (self.coeff_cal_1 * mean_speed - self.coeff_cal_2)
         return calories_per_kilo * self.weight / self.M_IN_KM * minutes
@@ -93,9 +106,10 @@ class Running(Training):
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
 
+    __slots__ = ('height',)
+
     coeff_1: float = 0.035
     coeff_2: float = 0.029
-    speed_pow: float = 2.0
 
     def __init__(self,
                  action: int,
@@ -105,15 +119,14 @@ class SportsWalking(Training):
         super().__init__(action, duration, weight)
         self.height = height
 
-    def get_spent_calories(self) -> float:
-        """Получить количество затраченных калорий.
+    def _calories_from(self, mean_speed: float) -> float:
+        """Посчитать калории по уже известной средней скорости.
 
         Рассчитывается по формуле:
         (0.035 * weight + (mean_speed**2 // height) * 0.029 * вес) * duration.
         """
         minutes = self.duration * self.MIN_IN_HOUR
-        mean_speed = self.get_mean_speed()
-        speed_to_height = mean_speed**self.speed_pow // self.height
+        speed_to_height = (mean_speed * mean_speed) // self.height
         cal_by_kilo = (self.coeff_1 + speed_to_height * self.coeff_2)
         by_minutes = self.weight * cal_by_kilo
         result = by_minutes * minutes
@@ -123,6 +136,8 @@ class SportsWalking(Training):
 class Swimming(Training):
     """Тренировка: плавание."""
 
+    __slots__ = ('length_pool', 'count_pool')
+
     LEN_STEP: float = 1.38
     ADD_COEFF: float = 1.1
     SPEED_COEFF: float = 2.0
@@ -137,30 +152,33 @@ class Swimming(Training):
         self.length_pool = length_pool
         self.count_pool = count_pool
 
-    def get_mean_speed(self) -> float:
-        """Получить среднюю скорость движения в км/ч."""
+    def _mean_speed_from(self, distance: float) -> float:
+        """Посчитать среднюю скорость по длине и числу бассейнов.
+
+        Дистанция по гребкам для скорости плавания не используется.
+        """
         total_length = self.length_pool * self.count_pool
         return total_length / self.M_IN_KM / self.duration
 
-    def get_spent_calories(self) -> float:
-        """Получить количество затраченных калорий.
+    def _calories_from(self, mean_speed: float) -> float:
+        """Посчитать калории по уже известной средней скорости.
 
         Рассчитывается по формуле:
         (mean_speed + 1.1) * 2 * weight.
         """
-        mean_speed = self.get_mean_speed()
         return (mean_speed + self.ADD_COEFF) * self.SPEED_COEFF * self.weight
 
 
+TRAINING_CLASSES: Dict[str, Type[Training]] = {
+    'SWM': Swimming,
+    'RUN': Running,
+    'WLK': SportsWalking
+}
+
+
 def read_package(workout_type: str, data: List[Union[int, float]]) -> Training:
     """Прочитать данные полученные от датчиков."""
-    traning_classes_map: Dict[str, Type[Training]] = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking
-    }
-
-    return traning_classes_map[workout_type](*data)
+    return TRAINING_CLASSES[workout_type](*data)
 
 
 def main(training: Training) -> None:
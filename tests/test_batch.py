@@ -0,0 +1,102 @@
+import pytest
+
+import batch
+import homework
+
+
+@pytest.mark.parametrize('input_data, expected', [
+    (('SWM', [720, 1, 80, 25, 40]), 336.0),
+    (('RUN', [9000, 1, 75]), 383.85),
+    (('WLK', [9000, 1, 75, 180]), 157.50000000000003),
+])
+def test_TrainingBatch_get_spent_calories(input_data, expected):
+    workout_type, data = input_data
+    training_batch = batch.TrainingBatch(workout_type, [data, data])
+    result = training_batch.get_spent_calories()
+    assert list(result) == pytest.approx([expected, expected]), (
+        'Проверьте формулу расчёта калорий для пакета тренировок.'
+    )
+
+
+def test_read_package_batch():
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 1, 75]),
+        ('WLK', [9000, 1, 75, 180]),
+        ('RUN', [1206, 12, 6]),
+    ]
+    batches = batch.read_package_batch(packages)
+    assert [item.workout_type for item in batches] == ['SWM', 'RUN', 'WLK']
+    for training_batch in batches:
+        expected = [
+            homework.read_package(workout_type, data).get_spent_calories()
+            for workout_type, data in packages
+            if workout_type == training_batch.workout_type
+        ]
+        result = training_batch.get_spent_calories()
+        assert list(result) == pytest.approx(expected), (
+            'Калории пакета должны совпадать с расчётом по одной тренировке.'
+        )
+
+
+def test_read_package_batch_unknown_type():
+    with pytest.raises(KeyError):
+        batch.read_package_batch([('TEST', [1, 2, 3])])
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('WLK', [[9000, 1, 75, 180], [9000, 1, 75]]),
+    ('RUN', [[9000, 1, 75, 180]]),
+    ('SWM', []),
+])
+def test_TrainingBatch_invalid_data(workout_type, data):
+    with pytest.raises(ValueError):
+        batch.TrainingBatch(workout_type, data)
+
+
+def test_TrainingBatch_walking_integer_boundary():
+    # speed**2 / height равно ровно 1: округление вниз не должно
+    # расходиться с расчётом по одной тренировке.
+    mean_speed = homework.SportsWalking(9000, 1, 75, 1).get_mean_speed()
+    data = [9000, 1, 75, mean_speed * mean_speed]
+    expected = homework.SportsWalking(*data).get_spent_calories()
+    result = batch.TrainingBatch('WLK', [data]).get_spent_calories()
+    assert expected == pytest.approx(288.0)
+    assert list(result) == pytest.approx([expected])
+
+
+@pytest.mark.parametrize('height', [1.3, 0.1])
+def test_TrainingBatch_walking_float_height(height):
+    data = [10000, 0.5, 75, height]
+    expected = homework.SportsWalking(*data).get_spent_calories()
+    result = batch.TrainingBatch('WLK', [data]).get_spent_calories()
+    assert list(result) == [expected]
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('RUN', [720, 0, 80]),
+    ('WLK', [720, 0, 80, 180]),
+    ('SWM', [720, 0, 80, 25, 40]),
+])
+def test_TrainingBatch_zero_duration(workout_type, data):
+    with pytest.raises(ZeroDivisionError):
+        homework.read_package(workout_type, data).get_spent_calories()
+    with pytest.raises(ZeroDivisionError):
+        batch.TrainingBatch(workout_type, [data]).get_spent_calories()
+
+
+def test_kernel_coefficients_match_training_classes():
+    running = homework.Running
+    walking = homework.SportsWalking
+    swimming = homework.Swimming
+    assert batch.RUN_SPEED_COEFF == (
+        running.coeff_cal_1 * running.LEN_STEP / running.M_IN_KM)
+    assert batch.RUN_SPEED_SHIFT == running.coeff_cal_2
+    assert batch.RUN_MINUTES_COEFF == running.MIN_IN_HOUR / running.M_IN_KM
+    assert batch.WLK_LEN_STEP == walking.LEN_STEP
+    assert batch.WLK_M_IN_KM == walking.M_IN_KM
+    assert batch.WLK_MIN_IN_HOUR == walking.MIN_IN_HOUR
+    assert batch.WLK_COEFF_1 == walking.coeff_1
+    assert batch.WLK_COEFF_2 == walking.coeff_2
+    assert batch.SWM_SPEED_COEFF == swimming.SPEED_COEFF / swimming.M_IN_KM
+    assert batch.SWM_SPEED_SHIFT == swimming.ADD_COEFF * swimming.SPEED_COEFF
@@ -191,12 +191,12 @@ def test_Training_show_training_info(monkeypatch):
         'Создайте метод `show_training_info` в классе `Training`.'
     )
 
-    def mock_get_spent_calories():
+    def mock_calories_from(self, mean_speed):
         return 100
     monkeypatch.setattr(
-        training,
-        'get_spent_calories',
-        mock_get_spent_calories
+        homework.Training,
+        '_calories_from',
+        mock_calories_from
     )
     result = training.show_training_info()
     assert result.__class__.__name__ == 'InfoMessage', (
@@ -205,6 +205,25 @@ def test_Training_show_training_info(monkeypatch):
     )
 
 
+def test_show_training_info_uses_mean_speed_override():
+    class FastRunning(homework.Running):
+        __slots__ = ()
+
+        def _mean_speed_from(self, distance):
+            return 100.0
+
+    training = FastRunning(9000, 1, 75)
+    result = training.show_training_info()
+    assert result.speed == 100.0, (
+        'Метод `show_training_info` должен использовать '
+        'переопределённый `_mean_speed_from`.'
+    )
+    assert result.calories == training.get_spent_calories(), (
+        'Метод `show_training_info` должен считать калории '
+        'так же, как `get_spent_calories`.'
+    )
+
+
 def test_Swimming():
     assert hasattr(homework, 'Swimming'), 'Создайте класс `Swimming`'
     assert inspect.isclass(homework.Swimming), (
@@ -363,3 +382,18 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('input_data, expected', [
+    ([10000, 0.5, 75, 1.3], 8496.000000000002),
+    ([10000, 0.5, 75, 0.1], 110286.0),
+])
+def test_SportsWalking_get_spent_calories_float_height(input_data, expected):
+    # speed**2 / height здесь округляется вверх до целого, поэтому
+    # результат отличается от math.floor(speed**2 / height).
+    sports_walking = homework.SportsWalking(*input_data)
+    result = sports_walking.get_spent_calories()
+    assert result == expected, (
+        'Проверьте формулу подсчёта потраченных '
+        'калорий в классе `SportsWalking`'
+    )